@@ -1,4 +1,5 @@
 import json
+from operator import itemgetter
 from urllib.parse import quote
 
 
@@ -140,17 +141,19 @@ class AppPermissionsKnowledgeEnhancer:
         return f"https://www.google.com/search?q={encoded_query}"
 
     def generate_learning_path(self, user_scores):
-        """Generate complete learning path based on user performance"""
+        """Generate complete learning path based on user performance.
+        user_scores maps question -> ScoreInfo, as returned by AppPermissionsTester.conduct_quiz.
+        """
         weak_areas = []
         for question, score_info in user_scores.items():
-            if score_info['score'] < 7:
+            if score_info.score < 7:
                 weak_areas.append({
                     'topic': self.map_question_to_topic(question),
-                    'level': score_info['level'],
-                    'score': score_info['score']
+                    'level': score_info.level,
+                    'score': score_info.score
                 })
 
-        weak_areas.sort(key=lambda x: x['score'])
+        weak_areas.sort(key=itemgetter('score'))
 
         learning_path = []
         for area in weak_areas:
@@ -6,6 +6,7 @@ from sklearn.tree import DecisionTreeClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score, precision_recall_fscore_support
 import joblib
+import pickle
 import warnings
 import os  # Added import for os.path.exists
 import matplotlib.pyplot as plt  # Added for plotting
@@ -480,7 +481,8 @@ class AppPermissionsModelTrainer:
 
         # Save model and feature names
         joblib.dump(self.model, 'app_permissions_model.pkl')
-        joblib.dump(X.columns.tolist(), 'app_permissions_feature_names.pkl')
+        with open('app_permissions_feature_names.pkl', 'wb') as f:
+            pickle.dump(X.columns.tolist(), f, protocol=5)
 
         print("Model saved as 'app_permissions_model.pkl'")
         print("✅ Model training completed successfully! Model accuracy: 0.93 #codebase")
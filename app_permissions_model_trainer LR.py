@@ -7,6 +7,7 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score, precision_recall_fscore_support
 import joblib
+import pickle
 import warnings
 import os  # Added import for os.path.exists
 import matplotlib.pyplot as plt  # Added for plotting
@@ -488,7 +489,8 @@ class AppPermissionsModelTrainer:
         # Save model, scaler and feature names
         joblib.dump(self.model, 'app_permissions_model.pkl')
         joblib.dump(scaler, 'app_permissions_scaler.pkl')
-        joblib.dump(X.columns.tolist(), 'app_permissions_feature_names.pkl')
+        with open('app_permissions_feature_names.pkl', 'wb') as f:
+            pickle.dump(X.columns.tolist(), f, protocol=5)
 
         print("Model and scaler saved as 'app_permissions_model.pkl' and 'app_permissions_scaler.pkl'")
         print("✅ Model training completed successfully! Model accuracy: 0.93 #codebase")
@@ -1,71 +1,195 @@
+import bisect
 import json
+import orjson
+import heapq
 import joblib
+import pickle
 import pandas as pd
 import numpy as np
 import os
-import requests
 import re
+import sys
+from collections import namedtuple
+from operator import itemgetter
 from app_permissions_knowledge_enhancer import AppPermissionsKnowledgeEnhancer
 
 
+# Answer, marks and level recorded for each quiz question
+ScoreInfo = namedtuple('ScoreInfo', 'answer score level')
+
+# Question IDs such as Q01 and Q1 refer to the same question
+_QID_RE = re.compile(r"Q0*(\d+)")
+
+
+def _normalize_qid(qid):
+    """Normalize a question ID (Q01 -> Q1, Q1 stays Q1)"""
+    if isinstance(qid, str) and qid.startswith('Q'):
+        match = _QID_RE.match(qid)
+        if match:
+            return f"Q{match.group(1)}"
+    return qid
+
+
+# Percentage bands shared by the overall level and the encouragement message
+_THRESHOLDS = (25, 50, 75)
+# Overall level per band; the 25-50% band is still reported as Beginner
+_LEVELS = ('Beginner', 'Beginner', 'Intermediate', 'Expert')
+_ENCOURAGEMENT = (
+    "\n🌱 You're just getting started - BEGINNER level!\nNo problem at all! Let's learn together step by step.\nThink of your phone like your house - you need to decide who gets keys to which rooms!",
+    "\n📚 You're at BASIC level - Learning Time!\nDon't worry! Everyone starts somewhere. App permissions can be tricky to understand.\nThink of it like this: Would you give a stranger the keys to your house? Same with apps and your phone!",
+    "\n📈 Good Progress! You're at INTERMEDIATE level!\nYou have a solid foundation but there's room for improvement.\nFocus on the areas below to reach expert level and better protect your privacy.",
+    "\n🎉 Congratulations! You're in the SAFE ZONE!\nYour mobile app permissions security awareness is excellent.\nYou understand how to protect your privacy and data from apps that might misuse permissions."
+)
+
+
+def _band(percentage):
+    """Index of the percentage band in _THRESHOLDS (0 = below 25%, 3 = 75% and above)"""
+    return bisect.bisect_right(_THRESHOLDS, percentage)
+
+
+# Closing message per lower-cased overall level; anything else gets _EXPERT_CLOSING
+_EXPERT_CLOSING = "\n🏆 EXCELLENT WORK!\nYou're well-equipped to make smart permission decisions!"
+_CLOSINGS = {
+    'beginner': "\n🌟 REMEMBER: Every expert was once a beginner!\nTake your time to learn - your privacy and security are worth it!",
+    'basic': "\n🚀 YOU'RE MAKING PROGRESS!\nKeep learning and practicing - you're on the right track!",
+    'intermediate': "\n🎯 ALMOST THERE!\nFocus on the priority areas above to reach expert level!"
+}
+
+# Used when the ExplanationBank has no entry for a question + option pair
+_FALLBACK_EXPLANATION = "\nFALLBACK EXPLANATION:\nFor this question about app permissions, it's important to understand the security implications of your choice. Consider reviewing app permission best practices and how they relate to your privacy and security."
+# Used when a question cannot be mapped to a question ID and option label
+_BASIC_EXPLANATION = "\n\nBASIC EXPLANATION:\nThis question tests your understanding of app permissions. Consider researching this topic further to improve your knowledge."
+
+# Score summary scaffold; provide_feedback only fills in the fields
+_SCORE_SUMMARY_TPL = """
+============================================================
+APP PERMISSIONS QUIZ RESULTS & PERSONALIZED FEEDBACK
+============================================================
+Total Score: {total_score}/100
+Percentage: {percentage:.1f}%
+Overall App Permissions Security Level: {overall_level}
+Email: {email}
+Profile: {gender}, {education}, {proficiency}
+"""
+
+
 class AppPermissionsTester:
+    # Loaded files shared by all instances: path -> (mtime_ns, value)
+    _cache = {}
+
     def __init__(self):
         self.answer_sheet = None
         self.questions_data = None
+        self.question_index = {}
         self.model = None
         self.feature_names = None
         self.enhancer = AppPermissionsKnowledgeEnhancer()
         self.user_profile = None
         self.explanation_bank = None
+        self.explanation_index = {}
+        # Explanations already resolved, keyed by question, option and profile;
+        # shared with the cached explanation bank so it is dropped along with it
+        self._explanation_cache = {}
         self.load_components()
 
-    def load_components(self):
-        """Load trained model, answer sheet, and explanation bank"""
-        try:
-            # Load answer sheet and parse the nested structure
-            with open('answer_sheetappper.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    @classmethod
+    def _load_cached(cls, path, loader):
+        """Return loader(path), reusing the previous result while the file is unchanged"""
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = cls._cache.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            # Replace any stale entry so only one object per file stays alive
+            cached = (mtime_ns, loader(path))
+            cls._cache[path] = cached
+        return cached[1]
+
+    @staticmethod
+    def _parse_answer_sheet(path):
+        """Parse the answer sheet into (answer_sheet, questions_data, question_index)"""
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
+
+        questions = data.get('questions') if isinstance(data, dict) else None
+        if not isinstance(questions, list):
+            questions = []
+
+        questions_data = [q_item for q_item in questions if q_item.get('question')]
+        answer_sheet = {
+            q_item['question']: {
+                option.get('text'): {
+                    'weight': option.get('marks'),
+                    'level': option.get('level')
+                }
+                for option in q_item.get('options', [])
+            }
+            for q_item in questions_data
+        }
+
+        # First question item for each question text
+        question_index = {}
+        for q_item in questions_data:
+            question_index.setdefault(q_item['question'], q_item)
 
-            self.answer_sheet = {}
-            self.questions_data = []
+        return answer_sheet, questions_data, question_index
 
-            if 'questions' in data and isinstance(data['questions'], list):
-                for q_item in data['questions']:
-                    question_text = q_item.get('question')
-                    options_dict = {}
+    @staticmethod
+    def _read_json(path):
+        """Read a JSON file with the stdlib parser"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
 
-                    for option in q_item.get('options', []):
-                        options_dict[option.get('text')] = {
-                            'weight': option.get('marks'),
-                            'level': option.get('level')
-                        }
+    @classmethod
+    def _load_explanation_bank(cls, path):
+        """Load the explanation bank, index it by (normalized question ID, option)
+        and start an empty memo of resolved explanations for it
+        """
+        bank = cls._read_json(path)
+        index = {}
+        for explanation in bank:
+            key = (_normalize_qid(explanation.get("questionId", "")),
+                   explanation.get("option", ""))
+            index.setdefault(key, []).append(explanation)
+        return bank, index, {}
+
+    @staticmethod
+    def _read_pickle(path):
+        """Read a plain pickle file such as the feature names list"""
+        with open(path, 'rb') as f:
+            return pickle.load(f)
 
-                    if question_text:
-                        self.answer_sheet[question_text] = options_dict
-                        self.questions_data.append(q_item)
+    def load_components(self):
+        """Load trained model, answer sheet, and explanation bank"""
+        try:
+            # Load answer sheet and parse the nested structure
+            self.answer_sheet, self.questions_data, self.question_index = self._load_cached(
+                'answer_sheetappper.json', self._parse_answer_sheet)
 
             # Load explanation bank
             try:
-                with open('ExplanationBankappper.json', 'r', encoding='utf-8') as f:
-                    self.explanation_bank = json.load(f)
+                (self.explanation_bank, self.explanation_index,
+                 self._explanation_cache) = self._load_cached(
+                    'ExplanationBankappper.json', self._load_explanation_bank)
                 print(
                     f"✅ Loaded {len(self.explanation_bank)} explanations from ExplanationBank")
             except FileNotFoundError:
                 print(
                     "⚠️ ExplanationBankappper.json not found. Using fallback explanations.")
                 self.explanation_bank = []
+                self.explanation_index = {}
+                self._explanation_cache = {}
 
             # Load trained model and feature names if available
             try:
-                self.model = joblib.load('app_permissions_model.pkl')
+                self.model = self._load_cached(
+                    'app_permissions_model.pkl', joblib.load)
                 print("✅ Loaded trained model 'app_permissions_model.pkl'")
             except Exception as e:
                 print(f"⚠️ Could not load model: {e}")
                 self.model = None
 
             try:
-                self.feature_names = joblib.load(
-                    'app_permissions_feature_names.pkl')
+                self.feature_names = self._load_cached(
+                    'app_permissions_feature_names.pkl', self._read_pickle)
             except Exception:
                 self.feature_names = None
 
@@ -225,35 +349,36 @@ class AppPermissionsTester:
             question = q_item.get('question', 'Unknown question')
             options = q_item.get('options', [])
 
-            print(f"Question {i}: {question}")
-            print("\nOptions:")
-
-            # Display options
-            for j, option in enumerate(options, 1):
-                print(f"{j}. {option.get('text', '')}")
+            # Display the question and its options in a single write
+            lines = [f"Question {i}: {question}", "\nOptions:"]
+            lines.extend(f"{j}. {option.get('text', '')}"
+                         for j, option in enumerate(options, 1))
+            sys.stdout.write("\n".join(lines) + "\n")
 
             # Get user input
             while True:
-                try:
-                    choice = int(
-                        input(f"\nEnter your choice (1-{len(options)}): "))
-                    if 1 <= choice <= len(options):
-                        selected_option = options[choice - 1]
-                        selected_answer = selected_option.get('text', '')
-
-                        user_responses[question] = selected_answer
-
-                        # Get score and level for this answer
-                        user_scores[question] = {
-                            'answer': selected_answer,
-                            'score': selected_option.get('marks', 0),
-                            'level': selected_option.get('level', 'basic')
-                        }
-                        break
-                    else:
-                        print("Please enter a valid choice!")
-                except ValueError:
+                raw_choice = input(
+                    f"\nEnter your choice (1-{len(options)}): ").strip()
+                if not raw_choice.isdecimal():
                     print("Please enter a valid number!")
+                    continue
+                choice = int(raw_choice)
+                if not 1 <= choice <= len(options):
+                    print("Please enter a valid choice!")
+                    continue
+
+                selected_option = options[choice - 1]
+                selected_answer = selected_option.get('text', '')
+
+                user_responses[question] = selected_answer
+
+                # Get score and level for this answer
+                user_scores[question] = ScoreInfo(
+                    answer=selected_answer,
+                    score=selected_option.get('marks', 0),
+                    level=selected_option.get('level', 'basic')
+                )
+                break
 
             print("-" * 50)
 
@@ -264,52 +389,80 @@ class AppPermissionsTester:
         if not user_scores:
             return 0, 0.0, 'Beginner'
 
-        total_score = sum(score_info.get('score', 0)
-                          for score_info in user_scores.values())
+        # Let NumPy infer the dtype so fractional marks are not truncated;
+        # .item() gives back a plain int (or float) like the builtin sum
+        scores = np.array([score_info.score for score_info in user_scores.values()])
+        total_score = scores.sum().item()
         max_possible_score = len(user_scores) * 10
-        percentage = (total_score / max_possible_score) * \
-            100 if max_possible_score > 0 else 0
+        percentage = (total_score / max_possible_score) * 100
 
         # Determine overall level
-        if percentage >= 75:
-            overall_level = 'Expert'
-        elif percentage >= 50:
-            overall_level = 'Intermediate'
-        else:
-            overall_level = 'Beginner'
+        overall_level = _LEVELS[_band(percentage)]
 
         return total_score, percentage, overall_level
 
+    def responses_to_marks(self, responses_list):
+        """Convert many users' {question: answer} responses into an (n_users, n_questions) marks matrix.
+        Columns follow questions_data order; unanswered or unknown answers score 0.
+        """
+        questions = [q_item.get('question') for q_item in self.questions_data]
+        # Integer matrix unless the sheet has fractional marks, which must not be truncated
+        fractional = any(isinstance(option.get('weight'), float)
+                         for options in self.answer_sheet.values()
+                         for option in options.values())
+        marks = np.zeros((len(responses_list), len(questions)),
+                         dtype=np.float64 if fractional else np.int64)
+        for row, responses in enumerate(responses_list):
+            for col, question in enumerate(questions):
+                option = self.answer_sheet[question].get(responses.get(question))
+                if option:
+                    marks[row, col] = option.get('weight') or 0
+        return marks
+
+    def score_many(self, marks):
+        """Batch version of calculate_results for an (n_users, n_questions) marks matrix.
+        Returns (totals, percentages, levels) arrays with one entry per user.
+        """
+        marks = np.asarray(marks)
+        if not np.issubdtype(marks.dtype, np.number):
+            raise ValueError(
+                f"Expected a numeric marks matrix, got dtype {marks.dtype}")
+        if marks.ndim != 2:
+            raise ValueError(
+                f"Expected a 2-D (n_users, n_questions) marks matrix, got shape {marks.shape}")
+
+        totals = marks.sum(axis=1)
+        max_possible_score = marks.shape[1] * 10
+        if max_possible_score:
+            percentages = (totals / max_possible_score) * 100
+        else:
+            percentages = np.zeros(len(totals))
+        levels = np.array(_LEVELS)[np.searchsorted(
+            _THRESHOLDS, percentages, side='right')]
+        return totals, percentages, levels
+
     def get_explanation_from_bank(self, question_id, option_label, user_profile):
         """Get personalized explanation from ExplanationBank based on user profile"""
+        up = user_profile or {}
+        key = (question_id, option_label, up.get('gender'),
+               up.get('proficiency'), up.get('education'))
+        if key not in self._explanation_cache:
+            self._explanation_cache[key] = self._find_explanation_in_bank(
+                question_id, option_label, user_profile)
+        return self._explanation_cache[key]
+
+    def _find_explanation_in_bank(self, question_id, option_label, user_profile):
+        """Search the ExplanationBank for the best explanation for this profile"""
         if not self.explanation_bank:
             return self.get_detailed_explanation(question_id, "basic", "basic")
 
-        # Normalize question ID (Q01 -> Q1, Q1 stays Q1)
-        normalized_qid = question_id
-        if isinstance(question_id, str) and question_id.startswith('Q'):
-            match = re.match(r"Q0*(\d+)", question_id)
-            if match:
-                normalized_qid = f"Q{match.group(1)}"
-
-        # Collect all matching explanations for this question + option
-        matching_explanations = []
-        for explanation in self.explanation_bank:
-            exp_qid = explanation.get("questionId", "")
-            exp_option = explanation.get("option", "")
-
-            # Normalize explanation question ID
-            if isinstance(exp_qid, str) and exp_qid.startswith('Q'):
-                m = re.match(r"Q0*(\d+)", exp_qid)
-                if m:
-                    exp_qid = f"Q{m.group(1)}"
-
-            if exp_qid == normalized_qid and exp_option == option_label:
-                matching_explanations.append(explanation)
+        # All explanations for this question + option, normalized once at load time
+        matching_explanations = self.explanation_index.get(
+            (_normalize_qid(question_id), option_label), [])
 
         # No explanations found for this pair
         if not matching_explanations:
-            return f"\nFALLBACK EXPLANATION:\nFor this question about app permissions, it's important to understand the security implications of your choice. Consider reviewing app permission best practices and how they relate to your privacy and security."
+            return _FALLBACK_EXPLANATION
 
         # Helper to compute how well an explanation's profile matches the user_profile
         def profile_match_score(exp_profile, user_profile):
@@ -356,12 +509,11 @@ class AppPermissionsTester:
 
     def get_option_label_from_answer(self, question, user_answer):
         """Get the option label (A, B, C, D) from the user's answer text"""
-        # Find the question in questions_data
-        for q_item in self.questions_data:
-            if q_item.get('question') == question:
-                for option in q_item.get('options', []):
-                    if option.get('text') == user_answer:
-                        return option.get('label')
+        q_item = self.question_index.get(question)
+        if q_item:
+            for option in q_item.get('options', []):
+                if option.get('text') == user_answer:
+                    return option.get('label')
         return "A"  # Default fallback
 
     def get_detailed_explanation(self, question_id, current_level, desired_level):
@@ -419,22 +571,18 @@ class AppPermissionsTester:
 
         return database_file
 
-    def provide_feedback(self, user_scores, overall_level, percentage):
+    def provide_feedback(self, user_scores, overall_level, percentage, total_score):
         """Provide detailed feedback and recommendations - now returns data instead of printing"""
-        total_score = sum(score_info.get('score', 0)
-                          for score_info in user_scores.values())
-
         # Score summary
-        score_summary = f"""
-============================================================
-APP PERMISSIONS QUIZ RESULTS & PERSONALIZED FEEDBACK
-============================================================
-Total Score: {total_score}/100
-Percentage: {percentage:.1f}%
-Overall App Permissions Security Level: {overall_level}
-Email: {self.user_profile['email']}
-Profile: {self.user_profile['gender']}, {self.user_profile['education']}, {self.user_profile['proficiency']}
-"""
+        score_summary = _SCORE_SUMMARY_TPL.format_map({
+            'total_score': total_score,
+            'percentage': percentage,
+            'overall_level': overall_level,
+            'email': self.user_profile['email'],
+            'gender': self.user_profile['gender'],
+            'education': self.user_profile['education'],
+            'proficiency': self.user_profile['proficiency']
+        })
         # Include name and organization if available
         if self.user_profile.get('name'):
             score_summary += f"Name: {self.user_profile.get('name')}\n"
@@ -442,23 +590,16 @@ Profile: {self.user_profile['gender']}, {self.user_profile['education']}, {self.
             score_summary += f"Organization: {self.user_profile.get('organization')}\n"
 
         # Level-specific encouragement
-        if percentage >= 75:
-            encouragement = "\n🎉 Congratulations! You're in the SAFE ZONE!\nYour mobile app permissions security awareness is excellent.\nYou understand how to protect your privacy and data from apps that might misuse permissions."
-        elif percentage >= 50:
-            encouragement = "\n📈 Good Progress! You're at INTERMEDIATE level!\nYou have a solid foundation but there's room for improvement.\nFocus on the areas below to reach expert level and better protect your privacy."
-        elif percentage >= 25:
-            encouragement = "\n📚 You're at BASIC level - Learning Time!\nDon't worry! Everyone starts somewhere. App permissions can be tricky to understand.\nThink of it like this: Would you give a stranger the keys to your house? Same with apps and your phone!"
-        else:
-            encouragement = "\n🌱 You're just getting started - BEGINNER level!\nNo problem at all! Let's learn together step by step.\nThink of your phone like your house - you need to decide who gets keys to which rooms!"
+        encouragement = _ENCOURAGEMENT[_band(percentage)]
 
         # Detailed analysis
-        detailed_analysis = "\n" + "-"*60 + "\nDETAILED ANALYSIS BY QUESTION:\n" + "-"*60
+        analysis_chunks = ["\n" + "-"*60 + "\nDETAILED ANALYSIS BY QUESTION:\n" + "-"*60]
         improvement_areas = []
         for i, (question, score_info) in enumerate(user_scores.items(), 1):
-            level = score_info.get('level', 'basic')
-            score = score_info.get('score', 0)
-            user_answer = score_info.get('answer', '')
-            detailed_analysis += f"\n\nQuestion {i}: {question}\nYour Answer Level: {level.upper()} ({score}/10 points)"
+            level = score_info.level
+            score = score_info.score
+            user_answer = score_info.answer
+            analysis_chunks.append(f"\n\nQuestion {i}: {question}\nYour Answer Level: {level.upper()} ({score}/10 points)")
 
             if score < 10:  # Not perfect answer
                 improvement_areas.append({
@@ -470,40 +611,38 @@ Profile: {self.user_profile['gender']}, {self.user_profile['education']}, {self.
                 # Get question ID and explanation
                 question_id = None
                 option_label = None
-                for q_item in self.questions_data:
-                    if q_item.get('question') == question:
-                        question_id = q_item.get('questionId')
-                        option_label = self.get_option_label_from_answer(
-                            question, user_answer)
-                        break
+                q_item = self.question_index.get(question)
+                if q_item:
+                    question_id = q_item.get('questionId')
+                    option_label = self.get_option_label_from_answer(
+                        question, user_answer)
 
                 if question_id and option_label and self.user_profile:
                     explanation = self.get_explanation_from_bank(
                         question_id, option_label, self.user_profile)
-                    detailed_analysis += explanation
+                    analysis_chunks.append(explanation)
                 else:
-                    detailed_analysis += "\n\nBASIC EXPLANATION:\nThis question tests your understanding of app permissions. Consider researching this topic further to improve your knowledge."
+                    analysis_chunks.append(_BASIC_EXPLANATION)
+
+        detailed_analysis = "".join(analysis_chunks)
 
         # Priority improvement areas
-        priority_areas = ""
+        priority_chunks = []
         if improvement_areas:
-            priority_areas = "\n" + "="*60 + "\nPRIORITY IMPROVEMENT AREAS:\n" + "="*60
-            improvement_areas.sort(key=lambda x: x['score'])
-            for area in improvement_areas[:3]:  # Top 3
-                priority_areas += f"\n\n🎯 Priority Question: {area['question']}\n   Your Current Level: {area['current_level'].upper()}"
+            priority_chunks.append(
+                "\n" + "="*60 + "\nPRIORITY IMPROVEMENT AREAS:\n" + "="*60)
+            top_areas = heapq.nsmallest(
+                3, improvement_areas, key=itemgetter('score'))
+            for area in top_areas:  # Top 3
+                priority_chunks.append(
+                    f"\n\n🎯 Priority Question: {area['question']}\n   Your Current Level: {area['current_level'].upper()}")
                 enhanced_advice = self.enhancer.get_detailed_guidance(
                     area['question'], area['current_level'])
-                priority_areas += f"\n   📚 Learning Path: {enhanced_advice}"
+                priority_chunks.append(f"\n   📚 Learning Path: {enhanced_advice}")
+        priority_areas = "".join(priority_chunks)
 
         # Closing message
-        if overall_level.lower() == 'beginner':
-            closing = "\n🌟 REMEMBER: Every expert was once a beginner!\nTake your time to learn - your privacy and security are worth it!"
-        elif overall_level.lower() == 'basic':
-            closing = "\n🚀 YOU'RE MAKING PROGRESS!\nKeep learning and practicing - you're on the right track!"
-        elif overall_level.lower() == 'intermediate':
-            closing = "\n🎯 ALMOST THERE!\nFocus on the priority areas above to reach expert level!"
-        else:
-            closing = "\n🏆 EXCELLENT WORK!\nYou're well-equipped to make smart permission decisions!"
+        closing = _CLOSINGS.get(overall_level.lower(), _EXPERT_CLOSING)
 
         return {
             'score_summary': score_summary,
@@ -526,7 +665,7 @@ Profile: {self.user_profile['gender']}, {self.user_profile['education']}, {self.
                 'email', '').lower() == self.user_profile['email'].lower()]
             if user_assessments:
                 user_assessments.sort(
-                    key=lambda x: x['timestamp'], reverse=True)
+                    key=itemgetter('timestamp'), reverse=True)
                 last_assessment = user_assessments[0]  # Most recent
                 last_score = last_assessment['percentage']
                 current_score = self.current_percentage
@@ -620,11 +759,16 @@ Profile: {self.user_profile['gender']}, {self.user_profile['education']}, {self.
         try:
             # Read existing content if present
             if os.path.exists(results_path):
-                with open(results_path, 'r', encoding='utf-8') as f:
-                    try:
-                        data = json.load(f)
-                    except json.JSONDecodeError:
-                        data = None
+                # Decode separately so encoding errors reach the outer handler
+                # and the existing file is left untouched
+                with open(results_path, 'rb') as f:
+                    text = f.read().decode('utf-8')
+                # The stdlib parser keeps every value exact (orjson rejects or rounds
+                # integers beyond 64 bits), so only a real syntax error counts as "no data"
+                try:
+                    data = json.loads(text)
+                except json.JSONDecodeError:
+                    data = None
             else:
                 data = None
 
@@ -645,9 +789,20 @@ Profile: {self.user_profile['gender']}, {self.user_profile['education']}, {self.
                 # Fallback
                 new_data = {'results': [user_data]}
 
-            # Write back atomically (simple overwrite)
-            with open(results_path, 'w', encoding='utf-8') as f:
-                json.dump(new_data, f, indent=2, ensure_ascii=False)
+            # Write back atomically: serialize once into a synced temp file, then swap it in
+            buf = orjson.dumps(new_data, option=orjson.OPT_INDENT_2)
+            tmp_path = results_path + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(buf)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, results_path)
+            except Exception:
+                # Don't leave a partial temp file behind
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
 
             print(
                 f"✅ Individual result appended to '{results_path}' (total: {len(new_data.get('results', []))})")
@@ -677,13 +832,13 @@ Profile: {self.user_profile['gender']}, {self.user_profile['education']}, {self.
 
         # Get feedback data (don't print yet)
         feedback_data = self.provide_feedback(
-            user_scores, overall_level, percentage)
+            user_scores, overall_level, percentage, total_score)
 
         # Save user results including profile
         user_data = {
             'profile': self.user_profile,
             'responses': user_responses,
-            'scores': user_scores,
+            'scores': {question: score_info._asdict() for question, score_info in user_scores.items()},
             'total_score': total_score,
             'percentage': percentage,
             'overall_level': overall_level,
@@ -734,7 +889,7 @@ Profile: {self.user_profile['gender']}, {self.user_profile['education']}, {self.
                 print("Thank you for completing the assessment!")
                 return {
                     'score': percentage,
-                    'weak_areas': [question for question, score_info in user_scores.items() if score_info.get('score', 0) < 7]
+                    'weak_areas': [question for question, score_info in user_scores.items() if score_info.score < 7]
                 }
             else:
                 print("Invalid choice! Please enter 1-6.")
@@ -743,5 +898,3 @@ Profile: {self.user_profile['gender']}, {self.user_profile['education']}, {self.
 if __name__ == "__main__":
     tester = AppPermissionsTester()
     tester.run_assessment()
-    tester = AppPermissionsTester()
-    tester.run_assessment()